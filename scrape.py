@@ -4,14 +4,29 @@ Scrapes Toronto Police ArcGIS endpoints for auto and bike theft data,
 cleans it, and writes JSON to public/data/ for the frontend.
 """
 
+import http.client
 import json
+import multiprocessing
 import os
 import sys
+import threading
 import time
-import urllib.request
 import urllib.parse
-import urllib.error
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 ENDPOINTS = {
     "auto": (
@@ -27,9 +42,15 @@ ENDPOINTS = {
 TIME_WINDOW_MONTHS = 3
 PAGE_SIZE = 2000
 OUTPUT_DIR = os.path.join("public", "data")
+CACHE_DIR = ".cache"
+SCHEMA_TTL = 24 * 60 * 60
+TRUSTED_SCHEMA_TTL = 7 * 24 * 60 * 60
 MAX_RETRIES = 3
 RETRY_DELAY = 5
 TIMEOUT = 60
+MAX_WORKERS = 8
+SIMDJSON_MIN_BYTES = 100_000
+POOL_MIN_PAGES = 25
 
 FIELD_MAP = {
     "id":            ["EVENT_UNIQUE_ID", "OBJECTID"],
@@ -45,6 +66,12 @@ FIELD_MAP = {
     "status":        ["STATUS"],
 }
 
+HEADERS = {
+    "User-Agent": "TorontoRadar/2.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+
 MONTH_NAMES = {
     "January": 1, "February": 2, "March": 3, "April": 4,
     "May": 5, "June": 6, "July": 7, "August": 8,
@@ -52,133 +79,363 @@ MONTH_NAMES = {
 }
 
 
+class ArcGISError(RuntimeError):
+    """The server answered with an ArcGIS error payload."""
+
+
 def now_utc():
     return datetime.now(timezone.utc)
 
 
-def http_get(url, params):
-    full_url = f"{url}?{urllib.parse.urlencode(params)}"
+# Both endpoints are scraped at once, so their progress lines are tagged and
+# written in one call; print() sends the newline separately, letting lines
+# from the two threads run together.
+def log(theft_type, message):
+    sys.stdout.write(f"  [{theft_type}] {message}\n")
+
+
+# Idle keep-alive connections keyed by (scheme, host), shared by all threads
+# so the TLS handshake is paid once per connection rather than once per page.
+_idle = {}
+_idle_lock = threading.Lock()
+
+
+def acquire_connection(scheme, host, reuse=True):
+    if reuse:
+        with _idle_lock:
+            conns = _idle.get((scheme, host))
+            if conns:
+                return conns.pop(), True
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=TIMEOUT), False
+    return http.client.HTTPConnection(host, timeout=TIMEOUT), False
+
+
+def release_connection(scheme, host, conn):
+    with _idle_lock:
+        _idle.setdefault((scheme, host), []).append(conn)
+
+
+# simdjson parsers keep a reusable buffer but must not be shared between
+# threads, so each page-fetching thread gets its own.
+_parsers = threading.local()
+
+
+def parse_json(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    if simdjson is not None and len(body) >= SIMDJSON_MIN_BYTES:
+        parser = getattr(_parsers, "parser", None)
+        if parser is None:
+            parser = _parsers.parser = simdjson.Parser()
+        return parser.parse(body, recursive=True)
+    return json.loads(body.decode("utf-8"))
+
+
+def send_request(parts, path, headers):
+    conn, reused = acquire_connection(parts.scheme, parts.netloc)
+    try:
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+        except (BrokenPipeError, ConnectionResetError):
+            if not reused:
+                raise
+            # The server closed this pooled socket while it sat idle. That is
+            # not a failed attempt, so go again at once on a fresh connection.
+            conn.close()
+            conn, _ = acquire_connection(parts.scheme, parts.netloc, reuse=False)
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+        body = resp.read()
+    except BaseException:
+        conn.close()
+        raise
+    if resp.will_close:
+        conn.close()
+    else:
+        release_connection(parts.scheme, parts.netloc, conn)
+    encoding = resp.getheader("Content-Encoding")
+    if encoding == "gzip":
+        body = zlib.decompress(body, zlib.MAX_WBITS | 16)
+    elif encoding == "deflate":
+        # "deflate" should be zlib-wrapped, but some servers send it raw.
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            body = zlib.decompress(body, -zlib.MAX_WBITS)
+    return resp, body
+
+
+# Returns (response, data); data is None when the server answers 304.
+def http_fetch(url, params, theft_type, headers=None):
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{urllib.parse.urlencode(params)}"
+    headers = {**HEADERS, **(headers or {})}
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            req = urllib.request.Request(full_url, headers={
-                "User-Agent": "TorontoRadar/2.0",
-                "Accept": "application/json",
-            })
-            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-                if "error" in data:
-                    code = data["error"].get("code", "?")
-                    msg = data["error"].get("message", "Unknown")
-                    raise RuntimeError(f"ArcGIS {code}: {msg}")
-                return data
-        except (urllib.error.URLError, urllib.error.HTTPError, RuntimeError, OSError) as e:
-            print(f"  Attempt {attempt}/{MAX_RETRIES} failed: {e}")
+            resp, body = send_request(parts, path, headers)
+            if resp.status == 304:
+                return resp, None
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status}: {resp.reason}")
+            data = parse_json(body)
+            if "error" in data:
+                code = data["error"].get("code", "?")
+                msg = data["error"].get("message", "Unknown")
+                raise ArcGISError(f"ArcGIS {code}: {msg}")
+            return resp, data
+        except (http.client.HTTPException, RuntimeError, OSError, zlib.error) as e:
+            log(theft_type, f"Attempt {attempt}/{MAX_RETRIES} failed: {e}")
             if attempt < MAX_RETRIES:
                 time.sleep(RETRY_DELAY)
             else:
                 raise
 
 
-def discover_fields(url):
+def http_get(url, params, theft_type):
+    return http_fetch(url, params, theft_type)[1]
+
+
+def load_cache(name):
+    try:
+        with open(os.path.join(CACHE_DIR, name), "rb") as f:
+            return parse_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def store_cache(name, data):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, name), "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def discover_fields(url, theft_type, revalidate=True):
+    # The field list comes from the layer metadata (.../FeatureServer/0),
+    # which rarely changes. It is cached between runs and revalidated with
+    # the server's ETag / Last-Modified; without either, or when the caller
+    # does not need revalidation, a TTL applies. The latter gets the longer
+    # TRUSTED_SCHEMA_TTL, as the daily schedule would age a 24 h entry out.
+    cache_name = f"schema_{theft_type}.json"
+    cached = load_cache(cache_name)
+    validators = {}
+    if cached and cached.get("fields"):
+        if cached.get("etag"):
+            validators["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            validators["If-Modified-Since"] = cached["last_modified"]
+        ttl = SCHEMA_TTL if revalidate else TRUSTED_SCHEMA_TTL
+        fresh = time.time() - cached.get("ts", 0) < ttl
+        if fresh and not (validators and revalidate):
+            log(theft_type, "Using cached field list")
+            return cached["fields"]
+
+    layer_url = url.rsplit("/query", 1)[0]
     try:
-        data = http_get(url, {"where": "1=1", "outFields": "*", "f": "json", "resultRecordCount": "1", "resultOffset": "0"})
-        features = data.get("features", [])
-        if features:
-            return list(features[0].get("attributes", {}).keys())
-        return [f["name"] for f in data.get("fields", [])]
+        resp, data = http_fetch(layer_url, {"f": "json"}, theft_type, validators)
     except Exception as e:
-        print(f"  Field discovery failed: {e}")
-        return []
+        log(theft_type, f"Field discovery failed: {e}")
+        return cached["fields"] if cached and cached.get("fields") else []
+
+    # A 304 need not repeat the validators, so keep the cached ones unless
+    # the response carries new values.
+    if data is None:
+        log(theft_type, "Field list unchanged since last run")
+        fields = cached["fields"]
+        etag = resp.getheader("ETag") or cached.get("etag")
+        last_modified = resp.getheader("Last-Modified") or cached.get("last_modified")
+    else:
+        fields = [f["name"] for f in data.get("fields", [])]
+        etag = resp.getheader("ETag")
+        last_modified = resp.getheader("Last-Modified")
+    if fields:
+        store_cache(cache_name, {
+            "fields": fields,
+            "etag": etag,
+            "last_modified": last_modified,
+            "ts": time.time(),
+        })
+    return fields
+
+
+_strategy_lock = threading.Lock()
+
+
+def remember_strategy(theft_type, key):
+    with _strategy_lock:
+        strategies = load_cache("strategy.json") or {}
+        if strategies.get(theft_type) != key:
+            strategies[theft_type] = key
+            store_cache("strategy.json", strategies)
 
 
 def build_where_clauses(available_fields):
     cutoff = now_utc() - timedelta(days=TIME_WINDOW_MONTHS * 30)
     clauses = []
 
+    # OCC_MONTH holds month names, so the month boundary inside the cutoff
+    # year is expressed as an IN list.
+    if "OCC_YEAR" in available_fields and "OCC_MONTH" in available_fields:
+        months = ", ".join(f"'{name}'" for name, num in MONTH_NAMES.items() if num >= cutoff.month)
+        clauses.append((
+            "month",
+            f"OCC_YEAR > {cutoff.year} OR (OCC_YEAR = {cutoff.year} AND OCC_MONTH IN ({months}))",
+            f"month >= {cutoff.year}-{cutoff.month:02d}",
+        ))
     if "OCC_YEAR" in available_fields:
-        clauses.append((f"OCC_YEAR >= {cutoff.year}", f"year >= {cutoff.year}"))
+        clauses.append(("year", f"OCC_YEAR >= {cutoff.year}", f"year >= {cutoff.year}"))
     if "OCC_DATE" in available_fields:
         ms = int(cutoff.timestamp() * 1000)
-        clauses.append((f"OCC_DATE >= {ms}", "OCC_DATE epoch"))
+        clauses.append(("occ_date", f"OCC_DATE >= {ms}", "OCC_DATE epoch"))
     if "REPORT_DATE" in available_fields:
         ms = int(cutoff.timestamp() * 1000)
-        clauses.append((f"REPORT_DATE >= {ms}", "REPORT_DATE epoch"))
+        clauses.append(("report_date", f"REPORT_DATE >= {ms}", "REPORT_DATE epoch"))
 
-    clauses.append(("1=1", "unfiltered"))
+    clauses.append(("unfiltered", "1=1", "unfiltered"))
     return clauses
 
 
-def fetch_features(url, theft_type):
-    print(f"\n  Fetching {theft_type} thefts...")
+def get_count(url, where, theft_type):
+    data = http_get(url, {"where": where, "returnCountOnly": "true", "f": "json"}, theft_type)
+    return int(data.get("count", 0))
+
+
+def select_out_fields(available):
+    wanted = {k for candidates in FIELD_MAP.values() for k in candidates}
+    return ",".join(sorted(wanted.intersection(available))) or "*"
+
+
+def fetch_page(url, where, out_fields, theft_type, offset):
+    params = {
+        "where": where, "outFields": out_fields, "outSR": "4326", "f": "json",
+        "geometryPrecision": "6",
+        "resultRecordCount": str(PAGE_SIZE), "resultOffset": str(offset),
+    }
+    return http_get(url, params, theft_type).get("features", [])
+
+
+def fetch_pages(url, where, out_fields, offsets, theft_type):
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        batches = pool.map(lambda o: fetch_page(url, where, out_fields, theft_type, o), offsets)
+        yield from batches
+
+
+def fetch_features(url, theft_type, executor):
+    log(theft_type, "Fetching thefts...")
 
-    available = discover_fields(url)
+    # With a known-good strategy from a previous run, a fresh cached schema
+    # is trusted as-is and the strategy is tried first.
+    preferred = (load_cache("strategy.json") or {}).get(theft_type)
+    available = discover_fields(url, theft_type, revalidate=preferred is None)
     if available:
-        print(f"  Found {len(available)} fields")
+        log(theft_type, f"Found {len(available)} fields")
+        out_fields = select_out_fields(available)
     else:
         available = ["OCC_YEAR", "OCC_DATE", "REPORT_DATE"]
+        out_fields = "*"
 
-    for where, label in build_where_clauses(available):
-        print(f"  Trying: {label}")
-        features = []
-        offset = 0
+    cutoff = now_utc() - timedelta(days=TIME_WINDOW_MONTHS * 30)
+    cutoff_ym = cutoff.year * 100 + cutoff.month
+
+    clauses = build_where_clauses(available)
+    rank = {key: n for n, (key, _, _) in enumerate(clauses)}
+    clauses.sort(key=lambda clause: clause[0] != preferred)
+    # A strategy is only remembered when every more precise one tried before
+    # it was rejected by the server (an error payload or no matches). Failing
+    # on the network says nothing about the filter, so it must not demote it.
+    unsure = len(clauses)
+    # A date filter that matches nothing may just have the wrong shape for
+    # this layer (e.g. numeric OCC_MONTH), so the next one is tried. The
+    # unfiltered 1=1 pull is reserved for when every date filter errored; if
+    # any was accepted, an empty window is taken as genuinely empty.
+    accepted = False
+    for key, where, label in clauses:
+        fetched = bad_coords = out_of_range = 0
+        if key == "unfiltered" and accepted:
+            log(theft_type, "No date filter matched any records")
+            records = []
+            break
+        log(theft_type, f"Trying: {label}")
 
         try:
-            while True:
-                params = {
-                    "where": where, "outFields": "*", "outSR": "4326", "f": "json",
-                    "resultRecordCount": str(PAGE_SIZE), "resultOffset": str(offset),
-                }
-                page = offset // PAGE_SIZE + 1
-                print(f"    Page {page} (offset={offset})...", end=" ", flush=True)
-                data = http_get(url, params)
-                batch = data.get("features", [])
-                print(f"{len(batch)} records")
-
-                if not batch:
-                    break
-
-                features.extend(batch)
-                offset += PAGE_SIZE
-
-                if len(features) >= 100_000:
-                    print("    Hit 100k limit, stopping")
-                    break
-                if not data.get("exceededTransferLimit", False) and len(batch) < PAGE_SIZE:
-                    break
-
-            if features:
-                print(f"  Got {len(features)} features via {label}")
-                break
+            total = get_count(url, where, theft_type)
+            if total == 0 and key != "unfiltered":
+                accepted = True
+                log(theft_type, f"  {label} matched no records")
+                continue
+            if total > 100_000:
+                log(theft_type, f"  {total} matches, capping at 100k")
+            offsets = range(0, min(total, 100_000), PAGE_SIZE)
+            log(theft_type, f"  {total} records in {len(offsets)} pages")
+
+            # The page count is known from the probe, so the per-page slots
+            # and the final record list are allocated once at full size.
+            results = [None] * len(offsets)
+            # Pickling only pays off near the 100k cap; see POOL_MIN_PAGES.
+            pooled = len(offsets) >= POOL_MIN_PAGES
+            # Each page is cleaned as soon as it arrives so raw features never
+            # pile up in memory; only the (much smaller) clean records are kept.
+            pages = fetch_pages(url, where, out_fields, offsets, theft_type)
+            for n, (offset, batch) in enumerate(zip(offsets, pages)):
+                log(theft_type, f"  Page {n + 1} (offset={offset}): {len(batch)} records")
+                if pooled:
+                    results[n] = executor.submit(process_page, batch, theft_type, offset, cutoff_ym)
+                else:
+                    results[n] = process_page(batch, theft_type, offset, cutoff_ym)
+                fetched += len(batch)
+            if pooled:
+                results = [future.result() for future in results]
+
+            records = [None] * sum(len(clean) for clean, _, _ in results)
+            idx = 0
+            for clean, bad, old in results:
+                records[idx:idx + len(clean)] = clean
+                idx += len(clean)
+                bad_coords += bad
+                out_of_range += old
+            log(theft_type, f"Got {fetched} features via {label}")
+            # Only a filter that actually returned rows is worth trying first.
+            if total > 0 and key != "unfiltered" and rank[key] < unsure:
+                remember_strategy(theft_type, key)
+            break
+        except ArcGISError as e:
+            log(theft_type, f"{label} failed: {e}")
+            continue
         except Exception as e:
-            print(f"\n  {label} failed: {e}")
+            log(theft_type, f"{label} failed: {e}")
+            unsure = min(unsure, rank[key])
             continue
     else:
-        print(f"  All strategies failed for {theft_type}")
+        log(theft_type, "All strategies failed")
         return []
 
-    def sort_key(f):
-        a = f.get("attributes", {})
-        d = a.get("OCC_DATE") or a.get("REPORT_DATE")
-        if isinstance(d, (int, float)) and d > 1_000_000_000:
-            return -d
-        y = a.get("OCC_YEAR", 0) or 0
-        m = a.get("OCC_MONTH", "")
-        if isinstance(m, str):
-            m = MONTH_NAMES.get(m, 0)
-        return -(y * 10000 + int(m or 0) * 100 + int(a.get("OCC_DAY", 0) or 0))
+    log(theft_type, f"{len(records)} valid, {bad_coords} bad coords, {out_of_range} outside window")
+    records.sort(key=itemgetter("date"), reverse=True)
+    return records
+
 
-    features.sort(key=sort_key)
-    return features
+def resolve_fields(available):
+    # (first present candidate, remaining present candidates) per field.
+    resolved = {}
+    for name, candidates in FIELD_MAP.items():
+        present = tuple(k for k in candidates if k in available)
+        resolved[name] = (present[0], present[1:]) if present else (None, ())
+    return resolved
 
 
-def first_of(attrs, keys, default=None):
+def first_of(attrs, keys):
     for k in keys:
         v = attrs.get(k)
         if v is not None:
             return v
-    return default
+    return None
 
 
+# The categorical columns (month names, OCC_DATE days, neighbourhoods,
+# premise types) repeat heavily, so their conversions are memoized and run
+# once per distinct value instead of once per record.
+@lru_cache(maxsize=None)
 def parse_month(raw):
     if isinstance(raw, (int, float)):
         return int(raw)
@@ -187,36 +444,66 @@ def parse_month(raw):
     return 1
 
 
-def parse_date(raw, year, month, day):
+@lru_cache(maxsize=None)
+def format_epoch(ms):
+    try:
+        return datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc).strftime("%Y-%m-%d")
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def clean_text(raw):
+    return str(raw).strip()
+
+
+def parse_date(raw, year, month, day, default_year):
     if isinstance(raw, (int, float)) and raw > 1_000_000_000:
-        try:
-            return datetime.fromtimestamp(raw / 1000.0, tz=timezone.utc).strftime("%Y-%m-%d")
-        except (OSError, ValueError):
-            pass
+        date_str = format_epoch(raw)
+        if date_str:
+            return date_str
     if isinstance(raw, str) and len(raw) >= 10:
         return raw[:10]
     try:
         return f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
     except (TypeError, ValueError):
-        return f"{now_utc().year}-01-01"
+        return f"{default_year}-01-01"
 
 
-def process(raw_features, theft_type):
-    cutoff = now_utc() - timedelta(days=TIME_WINDOW_MONTHS * 30)
-    cutoff_ym = cutoff.year * 100 + cutoff.month
+def process_page(raw_features, theft_type, offset, cutoff_ym):
     records = []
     bad_coords = 0
     out_of_range = 0
 
-    for f in raw_features:
+    # Every feature in a query result carries the same attribute keys, so
+    # the candidate columns present for each field are resolved once up front
+    # and bound to locals. The first one is read directly; the rest are only
+    # consulted when a record's value for it is null.
+    sample = raw_features[0].get("attributes", {}) if raw_features else {}
+    fields = resolve_fields(sample.keys())
+    year_key = fields["year"][0]
+    month_key = fields["month"][0]
+    hour_key = fields["hour"][0]
+    status_key = fields["status"][0]
+    id_key, id_rest = fields["id"]
+    date_key, date_rest = fields["date"]
+    day_key, day_rest = fields["day"]
+    neighbourhood_key, neighbourhood_rest = fields["neighbourhood"]
+    premise_key, premise_rest = fields["premise"]
+    lat_keys = (fields["lat"][0], *fields["lat"][1])
+    lng_keys = (fields["lng"][0], *fields["lng"][1])
+    append = records.append
+    default_year = now_utc().year
+
+    for i, f in enumerate(raw_features):
         attrs = f.get("attributes", {})
         geom = f.get("geometry", {})
 
         lat = geom.get("y") if geom else None
         lng = geom.get("x") if geom else None
         if lat is None or lng is None:
-            lat = first_of(attrs, FIELD_MAP["lat"])
-            lng = first_of(attrs, FIELD_MAP["lng"])
+            lat = first_of(attrs, lat_keys)
+            lng = first_of(attrs, lng_keys)
 
         try:
             lat = float(lat) if lat is not None else 0.0
@@ -224,15 +511,16 @@ def process(raw_features, theft_type):
         except (TypeError, ValueError):
             lat, lng = 0.0, 0.0
 
-        if (lat == 0 and lng == 0) or not (41 <= lat <= 57 and -95 <= lng <= -73):
+        # (0, 0) placeholders fall outside the bounding box too.
+        if not (41 <= lat <= 57 and -95 <= lng <= -73):
             bad_coords += 1
             continue
 
-        year = first_of(attrs, FIELD_MAP["year"], now_utc().year)
-        raw_month = first_of(attrs, FIELD_MAP["month"], 1)
-        month = parse_month(raw_month)
-        day = first_of(attrs, FIELD_MAP["day"], 1)
-        hour = first_of(attrs, FIELD_MAP["hour"], 12)
+        year = attrs.get(year_key)
+        if year is None:
+            year = default_year
+        raw_month = attrs.get(month_key)
+        month = parse_month(1 if raw_month is None else raw_month)
 
         try:
             if int(year) * 100 + int(month) < cutoff_ym:
@@ -241,54 +529,92 @@ def process(raw_features, theft_type):
         except (TypeError, ValueError):
             pass
 
-        raw_date = first_of(attrs, FIELD_MAP["date"], "")
-        date_str = parse_date(raw_date, year, month, day)
-
-        records.append({
-            "id": f"{theft_type}-{first_of(attrs, FIELD_MAP['id'], str(len(records)))}",
+        day = attrs.get(day_key)
+        if day is None and day_rest:
+            day = first_of(attrs, day_rest)
+        if day is None:
+            day = 1
+        hour = attrs.get(hour_key)
+        if hour is None:
+            hour = 12
+
+        raw_date = attrs.get(date_key)
+        if raw_date is None and date_rest:
+            raw_date = first_of(attrs, date_rest)
+        date_str = parse_date("" if raw_date is None else raw_date, year, month, day, default_year)
+
+        record_id = attrs.get(id_key)
+        if record_id is None and id_rest:
+            record_id = first_of(attrs, id_rest)
+        neighbourhood = attrs.get(neighbourhood_key)
+        if neighbourhood is None and neighbourhood_rest:
+            neighbourhood = first_of(attrs, neighbourhood_rest)
+        premise = attrs.get(premise_key)
+        if premise is None and premise_rest:
+            premise = first_of(attrs, premise_rest)
+        status = attrs.get(status_key)
+
+        append({
+            "id": offset + i if record_id is None else record_id,
             "type": theft_type,
             "date": date_str,
-            "year": int(year) if year else now_utc().year,
+            "year": int(year) if year else default_year,
             "month": month,
             "day": int(day) if day else 1,
             "hour": int(hour) if hour else 0,
-            "neighbourhood": str(first_of(attrs, FIELD_MAP["neighbourhood"], "Unknown")).strip(),
-            "premiseType": str(first_of(attrs, FIELD_MAP["premise"], "Unknown")).strip(),
+            "neighbourhood": clean_text("Unknown" if neighbourhood is None else neighbourhood),
+            "premiseType": clean_text("Unknown" if premise is None else premise),
             "lat": round(lat, 6),
             "lng": round(lng, 6),
-            "status": str(first_of(attrs, ["STATUS"], "Unknown")).strip(),
+            "status": clean_text("Unknown" if status is None else status),
         })
 
-    print(f"  {len(records)} valid, {bad_coords} bad coords, {out_of_range} outside window")
-    return records
+    return records, bad_coords, out_of_range
 
 
-def save(records, filename):
+def save(records, theft_type):
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    path = os.path.join(OUTPUT_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, separators=(",", ":"))
+    path = os.path.join(OUTPUT_DIR, f"{theft_type}_thefts.json")
+    # json.dump streams through iterencode with one write() per fragment;
+    # encoding to one buffer and writing it once keeps the C encoder path.
+    if orjson is not None:
+        data = orjson.dumps(records)
+    else:
+        data = json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
     kb = os.path.getsize(path) / 1024
-    print(f"  Saved {len(records)} records to {path} ({kb:.1f} KB)")
+    log(theft_type, f"Saved {len(records)} records to {path} ({kb:.1f} KB)")
+
+
+def scrape_endpoint(theft_type, url, executor):
+    try:
+        clean = fetch_features(url, theft_type, executor)
+        save(clean, theft_type)
+        return len(clean)
+    except Exception as e:
+        log(theft_type, f"Fatal error: {e}")
+        save([], theft_type)
+        return 0
 
 
 def main():
     print(f"Toronto Radar scraper — {now_utc().strftime('%Y-%m-%d %H:%M UTC')}")
-    print(f"Window: {TIME_WINDOW_MONTHS} months | Output: {os.path.abspath(OUTPUT_DIR)}")
+    print(f"Window: {TIME_WINDOW_MONTHS} months | Output: {os.path.abspath(OUTPUT_DIR)}\n")
 
     start = time.time()
-    total = 0
 
-    for theft_type, url in ENDPOINTS.items():
-        filename = f"{theft_type}_thefts.json"
-        try:
-            raw = fetch_features(url, theft_type)
-            clean = process(raw, theft_type)
-            save(clean, filename)
-            total += len(clean)
-        except Exception as e:
-            print(f"\n  Fatal error for {theft_type}: {e}")
-            save([], filename)
+    # The endpoints are independent and network-bound, so each gets its own
+    # thread; they share the connection pool and the cleaning processes.
+    # "spawn" because those threads are alive whenever pages are submitted,
+    # and forking a multi-threaded process is unsafe.
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+        with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as endpoints:
+            futures = [
+                endpoints.submit(scrape_endpoint, theft_type, url, executor)
+                for theft_type, url in ENDPOINTS.items()
+            ]
+            total = sum(future.result() for future in futures)
 
     elapsed = time.time() - start
     print(f"\nDone: {total:,} records in {elapsed:.1f}s")
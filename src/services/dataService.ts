@@ -126,16 +126,25 @@ async function fetchLive(url: string, type: 'auto' | 'bike'): Promise<TheftRecor
     .filter((r): r is TheftRecord => r !== null);
 }
 
+// The scraper writes the bare event number (or OBJECTID when a layer has
+// none); older files already carry the full '<type>-<id>' key.
+type StaticRecord = Omit<TheftRecord, 'id'> & { id: number | string };
+
 async function fetchStatic(path: string): Promise<TheftRecord[]> {
   const resp = await fetch(path);
   if (!resp.ok) throw new Error(`Not found: ${path}`);
-  const data: TheftRecord[] = await resp.json();
+  const data: StaticRecord[] = await resp.json();
   const cutoff = threeMonthsAgo();
   const now = new Date();
-  return data.filter((r) => {
-    const d = new Date(r.year, r.month - 1, r.day);
-    return d >= cutoff && d <= now;
-  });
+  return data
+    .filter((r) => {
+      const d = new Date(r.year, r.month - 1, r.day);
+      return d >= cutoff && d <= now;
+    })
+    .map((r) => {
+      const id = String(r.id);
+      return { ...r, id: id.startsWith(`${r.type}-`) ? id : `${r.type}-${id}` };
+    });
 }
 
 function deduplicate(records: TheftRecord[]): TheftRecord[] {